@@ -9,12 +9,17 @@ bl_info = {
 }
 
 import bpy
+import hashlib
+import itertools
 import os
 import struct
 import tempfile
 import time
 import ctypes
 from ctypes import wintypes
+from mathutils import Vector
+
+import numpy as np
 
 
 # -----------------------------------------------------------------------------
@@ -24,29 +29,103 @@ from ctypes import wintypes
 FOLDER_NAME = "Blender_IMGFromClipboard"
 STORAGE_DIR = os.path.join(tempfile.gettempdir(), FOLDER_NAME)
 
+_STORAGE_READY = False
+
 
-def ensure_storage_dir() -> str:
-    os.makedirs(STORAGE_DIR, exist_ok=True)
+def ensure_storage_dir(recreate: bool = False) -> str:
+    global _STORAGE_READY
+    if recreate or not _STORAGE_READY:
+        os.makedirs(STORAGE_DIR, exist_ok=True)
+        _STORAGE_READY = True
     return STORAGE_DIR
 
 
+# Session stamp + per-process counter: readable, and unique even for back-to-back pastes
+_SESSION_STAMP = time.strftime("%Y%m%d_%H%M%S")
+_BMP_SEQ = itertools.count()
+
+
 def make_unique_bmp_path() -> str:
-    ensure_storage_dir()
-    stamp = time.strftime("%Y%m%d_%H%M%S")
-    ms = int((time.time() - int(time.time())) * 1000)
-    return os.path.join(STORAGE_DIR, f"clipboard_{stamp}_{ms:03d}.bmp")
+    # STORAGE_DIR is created once in register(); open_in_storage_dir() recreates it if needed
+    name = f"clipboard_{_SESSION_STAMP}_{os.getpid()}_{next(_BMP_SEQ):06d}.bmp"
+    return os.path.join(STORAGE_DIR, name)
+
+
+def open_in_storage_dir(path: str, mode: str, buffering: int = -1):
+    try:
+        return open(path, mode, buffering=buffering)
+    except FileNotFoundError:
+        # STORAGE_DIR was removed after register() (by hand or by temp cleanup)
+        ensure_storage_dir(recreate=True)
+        return open(path, mode, buffering=buffering)
 
 
 # -----------------------------------------------------------------------------
 # Windows Clipboard (DIB) helpers
 # -----------------------------------------------------------------------------
 
+CF_BITMAP = 2
 CF_DIB = 8
 CF_DIBV5 = 17
 
-if os.name == "nt":
+DIB_RGB_COLORS = 0
+# CF_BITMAP handles up to this size are read with GetDIBits instead of CF_DIB
+BITMAP_FAST_PATH_MAX_PIXELS = 2048 * 2048
+
+BI_RGB = 0
+BI_BITFIELDS = 3
+BI_ALPHABITFIELDS = 6
+
+# Red/green/blue masks of a plain BGRA pixel (what every common app puts on the clipboard)
+BGRA_MASKS = (0x00FF0000, 0x0000FF00, 0x000000FF)
+
+user32 = None
+kernel32 = None
+gdi32 = None
+_WIN32_READY = False
+
+# Clipboard read buffer, reused across pastes and grown in whole MiB steps
+_DIB_BUF = None
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+class BITMAP(ctypes.Structure):
+    _fields_ = [
+        ("bmType", wintypes.LONG),
+        ("bmWidth", wintypes.LONG),
+        ("bmHeight", wintypes.LONG),
+        ("bmWidthBytes", wintypes.LONG),
+        ("bmPlanes", wintypes.WORD),
+        ("bmBitsPixel", wintypes.WORD),
+        ("bmBits", wintypes.LPVOID),
+    ]
+
+
+def _init_win32_api():
+    """Bind and prototype the Win32 clipboard functions on first use, not at add-on import."""
+    global user32, kernel32, gdi32, _WIN32_READY
+    if _WIN32_READY:
+        return
+
     user32 = ctypes.windll.user32
     kernel32 = ctypes.windll.kernel32
+    gdi32 = ctypes.windll.gdi32
 
     user32.OpenClipboard.argtypes = [wintypes.HWND]
     user32.OpenClipboard.restype = wintypes.BOOL
@@ -56,6 +135,12 @@ if os.name == "nt":
     user32.IsClipboardFormatAvailable.restype = wintypes.BOOL
     user32.GetClipboardData.argtypes = [wintypes.UINT]
     user32.GetClipboardData.restype = wintypes.HANDLE
+    user32.EnumClipboardFormats.argtypes = [wintypes.UINT]
+    user32.EnumClipboardFormats.restype = wintypes.UINT
+    user32.GetDC.argtypes = [wintypes.HWND]
+    user32.GetDC.restype = wintypes.HDC
+    user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+    user32.ReleaseDC.restype = ctypes.c_int
 
     kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
     kernel32.GlobalLock.restype = wintypes.LPVOID
@@ -64,11 +149,95 @@ if os.name == "nt":
     kernel32.GlobalSize.argtypes = [wintypes.HGLOBAL]
     kernel32.GlobalSize.restype = ctypes.c_size_t
 
+    gdi32.GetObjectW.argtypes = [wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID]
+    gdi32.GetObjectW.restype = ctypes.c_int
+    gdi32.GetDIBits.argtypes = [
+        wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
+        wintypes.LPVOID, wintypes.LPVOID, wintypes.UINT,
+    ]
+    gdi32.GetDIBits.restype = ctypes.c_int
+
+    _WIN32_READY = True
+
+
+def _dib_buffer(size: int) -> bytearray:
+    global _DIB_BUF
+    if _DIB_BUF is None or len(_DIB_BUF) < size:
+        _DIB_BUF = bytearray(((size + (1 << 20) - 1) >> 20) << 20)
+    return _DIB_BUF
+
+
+def _copy_to_dib_buffer(ptr, size: int):
+    buf = _dib_buffer(size)
+    ctypes.memmove((ctypes.c_ubyte * size).from_buffer(buf), ptr, size)
+    return memoryview(buf)[:size]
+
+
+def _native_image_format() -> int:
+    """
+    First image format the clipboard enumerates, i.e. the one the source app put
+    there (formats Windows synthesizes on request are enumerated after it).
+    The clipboard must be open.
+    """
+    fmt = user32.EnumClipboardFormats(0)
+    while fmt:
+        if fmt in (CF_BITMAP, CF_DIB, CF_DIBV5):
+            return fmt
+        fmt = user32.EnumClipboardFormats(fmt)
+    return 0
+
+
+def _read_bitmap_to_dib_buffer(hbm):
+    """
+    Convert a small CF_BITMAP handle into a bottom-up 32-bit DIB in the shared
+    buffer with GetDIBits, skipping the CF_DIB that Windows would otherwise
+    synthesize into a new global memory block. Returns None to fall back to CF_DIB.
+    """
+    bm = BITMAP()
+    if not gdi32.GetObjectW(hbm, ctypes.sizeof(bm), ctypes.byref(bm)):
+        return None
+
+    width, height = bm.bmWidth, abs(bm.bmHeight)
+    if width <= 0 or height <= 0 or width * height > BITMAP_FAST_PATH_MAX_PIXELS:
+        return None
+
+    header_size = ctypes.sizeof(BITMAPINFOHEADER)
+    size = header_size + width * height * 4
+    buf = _dib_buffer(size)
+
+    # The header we fill in tells GetDIBits which layout to produce
+    bih = BITMAPINFOHEADER.from_buffer(buf)
+    ctypes.memset(ctypes.addressof(bih), 0, header_size)
+    bih.biSize = header_size
+    bih.biWidth = width
+    bih.biHeight = height
+    bih.biPlanes = 1
+    bih.biBitCount = 32
+    bih.biCompression = BI_RGB
+    bits = ctypes.addressof(ctypes.c_ubyte.from_buffer(buf, header_size))
+
+    hdc = user32.GetDC(None)
+    if not hdc:
+        return None
+    try:
+        lines = gdi32.GetDIBits(hdc, hbm, 0, height, bits, ctypes.addressof(bih), DIB_RGB_COLORS)
+    finally:
+        user32.ReleaseDC(None, hdc)
+
+    if lines != height:
+        return None
+    return memoryview(buf)[:size]
+
 
 def get_clipboard_dib_bytes():
-    """Return DIB bytes from Windows clipboard or None."""
+    """
+    Return the DIB from Windows clipboard as a memoryview, or None.
+    The view is backed by a buffer shared between pastes: it is only valid until
+    the next call.
+    """
     if os.name != "nt":
         return None
+    _init_win32_api()
 
     fmt = None
     if user32.IsClipboardFormatAvailable(CF_DIBV5):
@@ -82,6 +251,12 @@ def get_clipboard_dib_bytes():
         return None
 
     try:
+        if _native_image_format() == CF_BITMAP:
+            hbm = user32.GetClipboardData(CF_BITMAP)
+            dib = _read_bitmap_to_dib_buffer(hbm) if hbm else None
+            if dib is not None:
+                return dib
+
         h = user32.GetClipboardData(fmt)
         if not h:
             return None
@@ -92,61 +267,113 @@ def get_clipboard_dib_bytes():
             return None
 
         try:
-            return ctypes.string_at(ptr, size)
+            return _copy_to_dib_buffer(ptr, size)
         finally:
             kernel32.GlobalUnlock(h)
     finally:
         user32.CloseClipboard()
 
 
-def dib_to_bmp_file_bytes(dib: bytes) -> bytes:
+# Built once at import: the color masks that follow the header, and the BITMAPFILEHEADER
+_MASKS = struct.Struct("<III")
+_BFH = struct.Struct("<2sIHHI")
+_BFH_BUF = bytearray(_BFH.size)
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def read_dib_header(dib):
     """
-    Wrap DIB (CF_DIB/CF_DIBV5) into a BMP file by adding BITMAPFILEHEADER.
+    Validate a DIB (CF_DIB/CF_DIBV5) header.
+    Returns (BITMAPINFOHEADER, pixel_offset), where pixel_offset is the start of
+    the pixel array relative to the DIB.
     """
-    if not dib or len(dib) < 40:
+    if not dib or len(dib) < ctypes.sizeof(BITMAPINFOHEADER):
         raise ValueError("Clipboard DIB data is invalid or too small.")
 
-    biSize = struct.unpack_from("<I", dib, 0)[0]
-    if biSize < 40 or len(dib) < biSize:
+    bih = BITMAPINFOHEADER.from_buffer_copy(dib, 0)
+    if bih.biSize < 40 or len(dib) < bih.biSize:
         raise ValueError("Invalid DIB header.")
 
-    biBitCount = struct.unpack_from("<H", dib, 14)[0]
-    biCompression = struct.unpack_from("<I", dib, 16)[0]
-    biClrUsed = struct.unpack_from("<I", dib, 32)[0]
-
     palette_entries = 0
-    if biBitCount <= 8:
-        palette_entries = biClrUsed if biClrUsed != 0 else (1 << biBitCount)
+    if bih.biBitCount <= 8:
+        palette_entries = bih.biClrUsed if bih.biClrUsed != 0 else (1 << bih.biBitCount)
     palette_size = palette_entries * 4  # RGBQUAD
 
     masks_size = 0
-    if biCompression in (3, 6):  # BI_BITFIELDS / BI_ALPHABITFIELDS
-        if biSize == 40:
-            masks_size = 12  # common case
-
-    off_bits = 14 + biSize + palette_size + masks_size
-    file_size = 14 + len(dib)
-
-    bfh = struct.pack("<2sIHHI", b"BM", file_size, 0, 0, off_bits)
-    return bfh + dib
+    if bih.biSize == 40:
+        # Masks follow a plain BITMAPINFOHEADER (larger headers contain them)
+        if bih.biCompression == BI_BITFIELDS:
+            masks_size = 12  # common case: R, G, B
+        elif bih.biCompression == BI_ALPHABITFIELDS:
+            masks_size = 16  # R, G, B, A
+
+    pixel_offset = bih.biSize + palette_size + masks_size
+    if len(dib) < pixel_offset:
+        raise ValueError("Invalid DIB header.")
+    return bih, pixel_offset
 
 
-def save_clipboard_image_to_disk() -> str:
+def save_clipboard_image_to_disk(dib) -> str:
     """
-    Saves clipboard image to STORAGE_DIR as BMP and returns the file path.
-    Returns empty string if no image.
+    Saves the clipboard DIB to STORAGE_DIR as BMP and returns the file path.
+    The BITMAPFILEHEADER and the DIB are written separately, so the image is never
+    copied into an intermediate BMP buffer.
     """
-    dib = get_clipboard_dib_bytes()
-    if not dib:
-        return ""
+    _, pixel_offset = read_dib_header(dib)
+    _BFH.pack_into(_BFH_BUF, 0, b"BM", 14 + len(dib), 0, 0, 14 + pixel_offset)
 
-    bmp_bytes = dib_to_bmp_file_bytes(dib)
     path = make_unique_bmp_path()
-    with open(path, "wb") as f:
-        f.write(bmp_bytes)
+    # Written under a temporary name and renamed when complete, so antivirus/indexer
+    # watchers never pick up (and lock) a half-written file. Users pasting very large
+    # images may want to exclude STORAGE_DIR from real-time scanning.
+    part_path = path + ".part"
+    try:
+        # Large buffer: small images go out in one write, large ones in header + body
+        with open_in_storage_dir(part_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(_BFH_BUF)
+            f.write(memoryview(dib))
+        os.replace(part_path, path)
+    except BaseException:
+        # Don't leave a half-written file behind in STORAGE_DIR
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
     return path
 
 
+# Content hash of a pasted DIB -> image name, so pasting the same clipboard image again
+# reuses it instead of writing and decoding it a second time
+_DIB_HASH_TO_IMAGE = {}
+DEDUP_MAX_BYTES = 32 << 20  # hashing larger images costs more than it saves
+
+
+def dib_digest(dib):
+    if len(dib) > DEDUP_MAX_BYTES:
+        return None
+    return hashlib.blake2b(dib, digest_size=16).digest()
+
+
+def find_pasted_image(digest):
+    if digest is None:
+        return None
+    img = bpy.data.images.get(_DIB_HASH_TO_IMAGE.get(digest, ""))
+    # Names are reused once an image is removed (undo, purge): only trust an image
+    # that still carries the digest it was pasted with
+    if img is None or img.get("clipboard_digest") != digest.hex():
+        _DIB_HASH_TO_IMAGE.pop(digest, None)
+        return None
+    return img
+
+
+def remember_pasted_image(digest, img: bpy.types.Image):
+    if digest is not None:
+        img["clipboard_digest"] = digest.hex()
+        _DIB_HASH_TO_IMAGE[digest] = img.name
+
+
 def load_image_from_path(path: str):
     try:
         return bpy.data.images.load(path, check_existing=False)
@@ -154,37 +381,205 @@ def load_image_from_path(path: str):
         return None
 
 
+def load_image_from_dib(dib, name: str = "Clipboard"):
+    """
+    Build an image datablock straight from the DIB pixel array, without a temp file.
+    Handles uncompressed 24/32-bit and BGRA bitfields; returns None for any other
+    layout so the caller can fall back to the BMP-on-disk path.
+    """
+    bih, pixel_offset = read_dib_header(dib)
+    width, height, bit_count, compression = bih.biWidth, bih.biHeight, bih.biBitCount, bih.biCompression
+    if width <= 0 or height == 0 or bit_count not in (24, 32):
+        return None
+
+    if compression in (BI_BITFIELDS, BI_ALPHABITFIELDS):
+        if bit_count != 32 or _MASKS.unpack_from(dib, 40) != BGRA_MASKS:
+            return None
+    elif compression != BI_RGB:
+        return None
+
+    rows = abs(height)
+    channels = bit_count // 8
+    row_stride = ((width * bit_count + 31) // 32) * 4  # rows are padded to 4 bytes
+    if len(dib) < pixel_offset + rows * row_stride:
+        return None
+
+    src = np.frombuffer(dib, dtype=np.uint8, count=rows * row_stride, offset=pixel_offset)
+    src = src.reshape(rows, row_stride)
+
+    if channels == 4:
+        # One uint32 per pixel (rows have no padding at 32 bpp): swap B and R with
+        # whole-pixel mask/shift ops instead of copying channel by channel
+        bgra = src.view(np.uint32)
+        pixels = bgra & 0xFF00FF00
+        pixels |= (bgra >> 16) & 0xFF
+        pixels |= (bgra & 0xFF) << 16
+        has_alpha = bool((bgra >> 24).any())
+        if not has_alpha:
+            # Alpha byte unused (all zero): fully opaque
+            pixels |= 0xFF000000
+        rgba = pixels.view(np.uint8)
+    else:
+        bgr = src[:, :width * 3].reshape(rows, width, 3)
+        has_alpha = False
+        rgba = np.empty((rows, width, 4), dtype=np.uint8)
+        rgba[..., 0] = bgr[..., 2]
+        rgba[..., 1] = bgr[..., 1]
+        rgba[..., 2] = bgr[..., 0]
+        rgba[..., 3] = 255
+
+    if height < 0:
+        # Top-down DIB; Blender (like a regular DIB) stores the bottom row first
+        rgba = rgba[::-1]
+
+    rgba = rgba.astype(np.float32)
+    rgba *= 1.0 / 255.0
+
+    img = bpy.data.images.new(name, width, rows, alpha=has_alpha)
+    img.pixels.foreach_set(rgba.ravel())
+    # Generated images are lost on save unless packed into the .blend
+    img.pack()
+    return img
+
+
+# Cost of a paste is dominated by moving the pixels (clipboard copy, float conversion,
+# optional file write), not by header parsing or Python call overhead. Changes here
+# should remove a full-image copy or a burst of syscalls rather than shave the
+# sub-KB header work.
+def image_from_clipboard(persist_copy: bool):
+    """
+    Get the clipboard image as an image datablock.
+    Returns (image, saved_path, error); image is None on failure and error says why.
+    """
+    dib = get_clipboard_dib_bytes()
+    if not dib:
+        return None, "", "No image found in clipboard."
+
+    saved_path = ""
+    digest = dib_digest(dib)
+    img = find_pasted_image(digest)
+
+    try:
+        # The copy on disk is write-only; the image itself is always built from memory
+        # (or reused when the same content was pasted before)
+        if persist_copy:
+            saved_path = save_clipboard_image_to_disk(dib)
+        if not img:
+            img = load_image_from_dib(dib)
+            if not img:
+                if not saved_path:
+                    saved_path = save_clipboard_image_to_disk(dib)
+                img = load_image_from_path(saved_path)
+    except ValueError as e:
+        return None, saved_path, str(e)
+    except OSError as e:
+        return None, saved_path, f"Failed to save clipboard image: {e}"
+
+    if not img:
+        return None, saved_path, f"Failed to load saved image: {saved_path}"
+    remember_pasted_image(digest, img)
+    return img, saved_path, ""
+
+
 # -----------------------------------------------------------------------------
 # Placement helpers
 # -----------------------------------------------------------------------------
 
-def ensure_object_mode():
-    if bpy.context.mode != "OBJECT":
-        try:
-            bpy.ops.object.mode_set(mode="OBJECT")
-        except Exception:
-            pass
+def ensure_object_mode(context):
+    # Only the active object can be in a non-object mode; checking it directly
+    # avoids going through the operator machinery in the common case.
+    active = context.view_layer.objects.active
+    if active is None or active.mode == "OBJECT":
+        return
+    try:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    except Exception:
+        pass
 
 
-def add_image_reference(img: bpy.types.Image):
-    ensure_object_mode()
-    bpy.ops.object.empty_add(type="IMAGE", align="VIEW")
-    obj = bpy.context.active_object
-    if not obj or obj.type != "EMPTY":
-        return None
+def link_new_object(context, obj: bpy.types.Object):
+    """
+    Place a freshly created object the way the Add menu does: at the 3D cursor,
+    aligned to the view, linked to the active collection (and local view),
+    selected and active.
+    Built on bpy.data directly, so no operator (poll, undo push, redraw) is involved.
+    """
+    obj.location = context.scene.cursor.location
+    rv3d = context.region_data
+    if isinstance(rv3d, bpy.types.RegionView3D):
+        obj.rotation_euler = rv3d.view_rotation.to_euler()
+
+    collection = context.collection or context.scene.collection
+    collection.objects.link(obj)
+
+    # The Add operators also put new objects into the current local view
+    space = context.space_data
+    if getattr(space, "local_view", None):
+        obj.local_view_set(space, True)
+
+    for o in context.selected_objects:
+        o.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+    return obj
+
+
+# Filled in by register(): which of these Object properties this Blender version has
+_HAS_SHOW_IN_FRONT = False
+_HAS_EMPTY_IMAGE_DEPTH = False
+
+
+def add_image_reference(context, img: bpy.types.Image):
+    ensure_object_mode(context)
+    obj = link_new_object(context, bpy.data.objects.new("Empty", None))
 
     obj.empty_display_type = "IMAGE"
     obj.data = img
 
-    if hasattr(obj, "show_in_front"):
+    if _HAS_SHOW_IN_FRONT:
         obj.show_in_front = True
-    if hasattr(obj, "empty_image_depth"):
+    if _HAS_EMPTY_IMAGE_DEPTH:
         obj.empty_image_depth = "FRONT"
 
     return obj
 
 
+# Image name_full -> material name. Names rather than ID references, because Python
+# references to datablocks become invalid after undo or loading another file.
+_MAT_CACHE = {}
+
+
+def _cached_material(img: bpy.types.Image):
+    mat = bpy.data.materials.get(_MAT_CACHE.get(img.name_full, ""))
+    if mat and mat.node_tree:
+        for node in mat.node_tree.nodes:
+            if node.type == "TEX_IMAGE" and node.image == img:
+                return mat
+    # Stale entry (material removed, renamed or edited): drop it
+    _MAT_CACHE.pop(img.name_full, None)
+    return None
+
+
+# Principled BSDF "Alpha" input moved when the node was reworked in Blender 4.0
+BSDF_ALPHA_INDEX = 4 if bpy.app.version >= (4, 0, 0) else 21
+
+
+def node_socket(sockets, index: int, name: str):
+    """Socket by its index, falling back to a name lookup if the layout differs."""
+    try:
+        sock = sockets[index]
+        if sock.name == name:
+            return sock
+    except IndexError:
+        pass
+    return sockets.get(name)
+
+
 def make_material_with_image(img: bpy.types.Image) -> bpy.types.Material:
+    cached = _cached_material(img)
+    if cached:
+        return cached
+
     mat = bpy.data.materials.new(name=f"Mat_{img.name}")
     mat.use_nodes = True
 
@@ -205,11 +600,13 @@ def make_material_with_image(img: bpy.types.Image) -> bpy.types.Material:
     out = nodes.new("ShaderNodeOutputMaterial")
     out.location = (250, 0)
 
-    links.new(tex.outputs.get("Color"), bsdf.inputs.get("Base Color"))
-    if tex.outputs.get("Alpha") and bsdf.inputs.get("Alpha"):
-        links.new(tex.outputs["Alpha"], bsdf.inputs["Alpha"])
+    links.new(node_socket(tex.outputs, 0, "Color"), node_socket(bsdf.inputs, 0, "Base Color"))
+    tex_alpha = node_socket(tex.outputs, 1, "Alpha")
+    bsdf_alpha = node_socket(bsdf.inputs, BSDF_ALPHA_INDEX, "Alpha")
+    if tex_alpha and bsdf_alpha:
+        links.new(tex_alpha, bsdf_alpha)
 
-    links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
+    links.new(node_socket(bsdf.outputs, 0, "BSDF"), node_socket(out.inputs, 0, "Surface"))
 
     # Guard for Blender-version differences
     if hasattr(mat, "blend_method"):
@@ -217,15 +614,24 @@ def make_material_with_image(img: bpy.types.Image) -> bpy.types.Material:
     if hasattr(mat, "shadow_method"):
         mat.shadow_method = "NONE"
 
+    _MAT_CACHE[img.name_full] = mat.name
     return mat
 
 
-def add_mesh_plane_with_image(img: bpy.types.Image):
-    ensure_object_mode()
-    bpy.ops.mesh.primitive_plane_add(align="VIEW")
-    obj = bpy.context.active_object
-    if not obj or obj.type != "MESH":
-        return None
+# Same 2x2 plane (and UVs) as Add > Mesh > Plane
+PLANE_VERTS = [(-1.0, -1.0, 0.0), (1.0, -1.0, 0.0), (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)]
+PLANE_UVS = (0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0)
+
+
+def add_mesh_plane_with_image(context, img: bpy.types.Image):
+    ensure_object_mode(context)
+
+    mesh = bpy.data.meshes.new("Plane")
+    mesh.from_pydata(PLANE_VERTS, [], [(0, 1, 2, 3)])
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", PLANE_UVS)
+    mesh.update()
+
+    obj = link_new_object(context, bpy.data.objects.new("Plane", mesh))
 
     # Scale to match aspect ratio (nice default)
     w = max(1, img.size[0])
@@ -252,7 +658,7 @@ class WM_OT_img_from_clipboard(bpy.types.Operator):
     bl_label = "IMGFromClipboard"
     bl_description = (
         "Imports an image from the Windows clipboard.\n"
-        f"Images are saved to: {TOOLTIP_PATH}"
+        f"Copies kept on disk are saved to: {TOOLTIP_PATH}"
     )
     bl_options = {"REGISTER", "UNDO"}
 
@@ -265,37 +671,102 @@ class WM_OT_img_from_clipboard(bpy.types.Operator):
         default="REFERENCE",
     )
 
+    persist_copy: bpy.props.BoolProperty(
+        name="Keep Copy on Disk",
+        description=f"Also save the clipboard image as a BMP in: {TOOLTIP_PATH}",
+        default=False,
+    )
+
     def execute(self, context):
         if os.name != "nt":
             self.report({"WARNING"}, "IMGFromClipboard is Windows-only.")
             return {"CANCELLED"}
 
-        saved_path = save_clipboard_image_to_disk()
-        if not saved_path:
-            self.report({"WARNING"}, "No image found in clipboard.")
-            return {"CANCELLED"}
-
-        img = load_image_from_path(saved_path)
+        img, saved_path, error = image_from_clipboard(self.persist_copy)
         if not img:
-            self.report({"WARNING"}, f"Failed to load saved image: {saved_path}")
+            self.report({"WARNING"}, error)
             return {"CANCELLED"}
 
         if self.mode == "MESH":
-            obj = add_mesh_plane_with_image(img)
+            obj = add_mesh_plane_with_image(context, img)
         else:
-            obj = add_image_reference(img)
+            obj = add_image_reference(context, img)
 
         if not obj:
             self.report({"WARNING"}, "Failed to create object.")
             return {"CANCELLED"}
 
-        self.report({"INFO"}, f"Imported from clipboard ({self.mode}). Saved at: {saved_path}")
+        if saved_path:
+            self.report({"INFO"}, f"Imported from clipboard ({self.mode}). Saved at: {saved_path}")
+        else:
+            self.report({"INFO"}, f"Imported from clipboard ({self.mode}).")
+        return {"FINISHED"}
+
+
+class WM_OT_img_from_clipboard_batch(bpy.types.Operator):
+    bl_idname = "wm.img_from_clipboard_batch"
+    bl_label = "IMGFromClipboard (Batch)"
+    bl_description = (
+        "Places several copies of the clipboard image in a row, for scripts.\n"
+        "The clipboard is read and decoded once for the whole batch"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    mode: bpy.props.EnumProperty(
+        name="Import As",
+        items=[
+            ("REFERENCE", "Reference", "Create Image Empties (Reference)"),
+            ("MESH", "Mesh", "Create Planes with the image as material"),
+        ],
+        default="REFERENCE",
+    )
+
+    count: bpy.props.IntProperty(
+        name="Count",
+        description="Number of objects to create",
+        default=1,
+        min=1,
+        soft_max=100,
+    )
+
+    spacing: bpy.props.FloatProperty(
+        name="Spacing",
+        description="Distance between consecutive objects, along the view's horizontal axis",
+        default=4.0,
+        subtype="DISTANCE",
+    )
+
+    persist_copy: bpy.props.BoolProperty(
+        name="Keep Copy on Disk",
+        description=f"Also save the clipboard image as a BMP in: {TOOLTIP_PATH}",
+        default=False,
+    )
+
+    def execute(self, context):
+        if os.name != "nt":
+            self.report({"WARNING"}, "IMGFromClipboard is Windows-only.")
+            return {"CANCELLED"}
+
+        img, saved_path, error = image_from_clipboard(self.persist_copy)
+        if not img:
+            self.report({"WARNING"}, error)
+            return {"CANCELLED"}
+
+        add = add_mesh_plane_with_image if self.mode == "MESH" else add_image_reference
+        for i in range(self.count):
+            obj = add(context, img)
+            obj.location += obj.rotation_euler.to_matrix() @ Vector((i * self.spacing, 0.0, 0.0))
+
+        msg = f"Imported {self.count} from clipboard ({self.mode})."
+        if saved_path:
+            msg += f" Saved at: {saved_path}"
+        self.report({"INFO"}, msg)
         return {"FINISHED"}
 
 
 class VIEW3D_MT_img_from_clipboard(bpy.types.Menu):
     bl_label = "IMGFromClipboard"
-    bl_description = f"Images are saved to: {TOOLTIP_PATH}"
+    bl_description = f"Copies kept on disk are saved to: {TOOLTIP_PATH}"
 
     def draw(self, context):
         layout = self.layout
@@ -313,11 +784,17 @@ def draw_img_from_clipboard_in_add_menu(self, context):
 
 classes = (
     WM_OT_img_from_clipboard,
+    WM_OT_img_from_clipboard_batch,
     VIEW3D_MT_img_from_clipboard,
 )
 
 
 def register():
+    global _HAS_SHOW_IN_FRONT, _HAS_EMPTY_IMAGE_DEPTH
+    object_props = bpy.types.Object.bl_rna.properties
+    _HAS_SHOW_IN_FRONT = "show_in_front" in object_props
+    _HAS_EMPTY_IMAGE_DEPTH = "empty_image_depth" in object_props
+
     ensure_storage_dir()
     for c in classes:
         bpy.utils.register_class(c)
@@ -325,6 +802,8 @@ def register():
 
 
 def unregister():
+    global _DIB_BUF
+    _DIB_BUF = None
     bpy.types.VIEW3D_MT_add.remove(draw_img_from_clipboard_in_add_menu)
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
\ No newline at end of file